@@ -96,8 +96,8 @@ def is_update_needed(url, latest_version, expected_sha256=None):
 
 def close_other_instances():
     log("Closing any running instances of Cursor (user only)...")
-    subprocess.run(["pkill", "-u", os.getlogin(), "-f", str(BIN_PATH)], check=False)
-    subprocess.run(["pkill", "-u", os.getlogin(), "-f", "cursor"], check=False)
+    subprocess.run(["pkill", "-U", str(os.getuid()), "-f", str(BIN_PATH)], check=False)
+    subprocess.run(["pkill", "-U", str(os.getuid()), "-f", "cursor"], check=False)
     time.sleep(1)
 
 def download_and_install(url, version):
@@ -16,18 +16,29 @@ Author: swipswaps
 License: MIT
 """
 
+import argparse
+import errno
 import os
 import sys
 import subprocess
-import requests
-import shutil
 import tempfile
 import hashlib
+import importlib
+import importlib.util
 import time
 import json
-import platform
+import random
+import site
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, Any, List
+
+# requests (and urllib3, idna, certifi, ...) is imported only once a network
+# call is actually needed, keeping the warm "already up to date" path fast
+if TYPE_CHECKING:
+    import requests
 
 # Configuration
 APP_NAME = "Cursor"
@@ -35,8 +46,10 @@ APP_VERSION = "1.5"
 USER_INSTALL = True  # Always use user install for security
 INSTALL_DIR = Path.home() / "Applications" / "cursor"
 BIN_PATH = INSTALL_DIR / "cursor.AppImage"
+BIN_ETAG = INSTALL_DIR / "cursor.AppImage.etag"
 ICON_PATH = INSTALL_DIR / "cursor.png"
 VERSION_FILE = INSTALL_DIR / ".version"
+API_CACHE = INSTALL_DIR / ".api_cache.json"
 DESKTOP_FILE = Path.home() / ".local/share/applications/cursor.desktop"
 
 # API Configuration
@@ -46,10 +59,25 @@ ICON_URLS = [
     "https://www.cursor.com/favicon.png",
     "https://raw.githubusercontent.com/getcursor/cursor/main/resources/icon.png",
 ]
+API_CACHE_TTL = 3600  # seconds a cached API response stays valid
 
 # System requirements
 MIN_PYTHON_VERSION = (3, 6)
-REQUIRED_PACKAGES = ["requests", "Pillow"]
+REQUIRED_PACKAGES = ["requests"]  # Pillow is optional (placeholder icon only)
+PACKAGE_MODULES = {"requests": "requests", "Pillow": "PIL"}  # pip name -> import name
+
+# Network retry policy: connection errors and these statuses are retried by
+# the session adapter; other 4xx responses won't succeed on retry
+RETRY_STATUS = [408, 429, 500, 502, 503, 504]
+
+# I/O tuning
+_HASH_CHUNK = 1 << 20  # 1 MiB reads when hashing the AppImage
+_DOWNLOAD_CHUNK = 1 << 20  # 1 MiB reads from the response when downloading
+
+# Install steps run on worker threads; serialize creation of INSTALL_DIR
+_INSTALL_DIR_LOCK = threading.Lock()
+_SESSION_LOCK = threading.Lock()
+_SESSION = None
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -72,8 +100,15 @@ def err(msg: str) -> None:
     sys.stderr.write(f"{Colors.RED}[ERROR]{Colors.RESET} {msg}\n")
     sys.exit(1)
 
+def ensure_install_dir() -> None:
+    """Create INSTALL_DIR; safe to call from several install threads"""
+    with _INSTALL_DIR_LOCK:
+        INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+
 def check_system_requirements() -> None:
     """Verify system meets minimum requirements"""
+    import platform
+    
     log("Checking system requirements...")
     
     # Check Python version
@@ -90,27 +125,33 @@ def check_system_requirements() -> None:
         warn(f"Architecture {platform.machine()} may not be supported. "
              "Proceeding anyway...")
 
+def is_importable(package: str) -> bool:
+    """Whether the pip package's module can be found, without importing it"""
+    return importlib.util.find_spec(PACKAGE_MODULES.get(package, package)) is not None
+
 def install_deps() -> None:
     """Install required Python dependencies"""
     log("Checking and installing required Python dependencies...")
     
-    for package in REQUIRED_PACKAGES:
-        try:
-            if package == "requests":
-                import requests  # noqa
-            elif package == "Pillow":
-                import PIL  # noqa
-            log(f"{package} is already installed.")
-        except ImportError:
-            log(f"{package} not found. Installing with pip --user...")
-            try:
-                subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "--user", package],
-                    check=True, capture_output=True, text=True
-                )
-                log(f"{package} installed successfully.")
-            except subprocess.CalledProcessError as e:
-                err(f"Failed to install {package}: {e.stderr}")
+    missing = [package for package in REQUIRED_PACKAGES if not is_importable(package)]
+    if not missing:
+        log(f"{', '.join(REQUIRED_PACKAGES)} already installed.")
+        return
+    
+    # One pip run for everything: pip's own startup dominates the cost
+    log(f"{', '.join(missing)} not found. Installing with pip --user...")
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", "--user", *missing],
+            check=True, capture_output=True, text=True
+        )
+        # Let the lazy imports see the freshly installed packages; the user
+        # site dir isn't on sys.path if it didn't exist when Python started
+        site.addsitedir(site.getusersitepackages())
+        importlib.invalidate_caches()
+        log(f"{', '.join(missing)} installed successfully.")
+    except subprocess.CalledProcessError as e:
+        err(f"Failed to install {', '.join(missing)}: {e.stderr}")
 
 def set_libgl_env() -> None:
     """Set LIBGL_ALWAYS_SOFTWARE=1 for better compatibility"""
@@ -132,18 +173,83 @@ def set_libgl_env() -> None:
     except Exception as e:
         warn(f"Failed to update .profile: {e}")
 
-def fetch_download_info() -> Tuple[str, str, Optional[str]]:
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff (1s, 2s, 4s, ... capped at 30s) with up to 50% jitter"""
+    return min(30.0, 2.0 ** (attempt - 1)) * (1 + random.random() * 0.5)
+
+def make_session() -> "requests.Session":
+    """Build a pooled Session that retries connection errors and RETRY_STATUS"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=RETRY_STATUS,
+                  raise_on_status=False)
+    # Reuse TLS connections to cursor.com across the API, download and icon calls
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                          max_retries=retry))
+    session.headers["User-Agent"] = "Cursor-Installer/1.5"
+    return session
+
+def get_session() -> "requests.Session":
+    """Return the shared Session, creating it on first use"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = make_session()
+        return _SESSION
+
+def read_api_cache() -> Optional[Dict[str, Any]]:
+    """Return the cached API response (fresh or stale), or None if unusable"""
+    try:
+        cached = json.loads(API_CACHE.read_text())
+        if (cached.get("url") and isinstance(cached.get("version"), str)
+                and isinstance(cached.get("fetched_at"), (int, float))):
+            return cached
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+def write_api_cache(url: str, version: str, etag: Optional[str] = None) -> None:
+    """Atomically store the API response (and its ETag) next to VERSION_FILE"""
+    try:
+        ensure_install_dir()
+        tmp = API_CACHE.with_name(API_CACHE.name + ".tmp")
+        tmp.write_text(json.dumps({"url": url, "version": version, "etag": etag,
+                                   "fetched_at": time.time()}))
+        os.replace(tmp, API_CACHE)
+    except OSError as e:
+        warn(f"Failed to write API cache: {e}")
+
+def fetch_download_info(use_cache: bool = True) -> Tuple[str, str, Optional[str]]:
     """Fetch latest AppImage information from Cursor API"""
+    cached = read_api_cache()
+    if use_cache and cached and time.time() - cached["fetched_at"] < API_CACHE_TTL:
+        log(f"Using cached AppImage info (version {cached['version']})")
+        return cached["url"], cached["version"], None
+    
+    import requests
+    
     log("Fetching latest AppImage info...")
+    headers = {"Accept": "application/json"}
+    # Revalidate a stale cache entry; a 304 carries no body
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
     
     try:
         # Follow redirects and handle JSON response
-        r = requests.get(API_URL, headers={
-            "Accept": "application/json",
-            "User-Agent": "Cursor-Installer/1.5"
-        }, timeout=15, allow_redirects=True)
+        r = get_session().get(API_URL, headers=headers, timeout=15, allow_redirects=True)
         r.raise_for_status()
-        
+    except requests.exceptions.RequestException as e:
+        err(f"Failed to fetch API data: {e}")
+    
+    if r.status_code == 304:
+        log(f"API response unchanged (version {cached['version']})")
+        write_api_cache(cached["url"], cached["version"], cached["etag"])
+        return cached["url"], cached["version"], None
+    
+    try:
         data = r.json()
         download_url = data.get("downloadUrl")
         version = data.get("version", "unknown")
@@ -152,58 +258,184 @@ def fetch_download_info() -> Tuple[str, str, Optional[str]]:
             err("downloadUrl not found in API response.")
         
         log(f"Found version {version}")
+        write_api_cache(download_url, version, r.headers.get("ETag"))
         return download_url, version, None
         
-    except requests.exceptions.RequestException as e:
-        err(f"Failed to fetch API data: {e}")
     except json.JSONDecodeError as e:
         err(f"Invalid JSON response from API: {e}")
 
 def sha256sum(file_path: Path) -> str:
     """Calculate SHA256 hash of a file"""
-    h = hashlib.sha256()
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
+        # Unbuffered: we already read in large chunks ourselves
+        with open(file_path, "rb", buffering=0) as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+, loop runs in C
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            # Reuse one buffer and hand hashlib zero-copy views of it
+            h = hashlib.sha256()
+            buf = bytearray(_HASH_CHUNK)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(view[:n])
         return h.hexdigest()
     except Exception as e:
         err(f"Failed to calculate checksum: {e}")
 
+def hash_cache_path(file_path: Path) -> Path:
+    """Sidecar file holding the cached digest of file_path"""
+    return file_path.with_suffix(".sha256")
+
+def write_hash_cache(file_path: Path, digest: str) -> None:
+    """Record digest for file_path's current size and mtime"""
+    try:
+        st = file_path.stat()
+        cache = hash_cache_path(file_path)
+        tmp = cache.with_name(cache.name + ".tmp")
+        tmp.write_text(json.dumps({"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                                   "digest": digest}))
+        os.replace(tmp, cache)
+    except OSError as e:
+        warn(f"Failed to write checksum cache: {e}")
+
+def cached_sha256sum(file_path: Path) -> str:
+    """sha256sum() that skips re-hashing while size and mtime are unchanged"""
+    try:
+        st = file_path.stat()
+        cached = json.loads(hash_cache_path(file_path).read_text())
+        if cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+            return cached["digest"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    digest = sha256sum(file_path)
+    write_hash_cache(file_path, digest)
+    return digest
+
 def download_with_progress(url: str, dest_path: Path, desc: str = "Downloading", 
-                          retries: int = 3, fatal: bool = True) -> bool:
-    """Download file with progress bar and retry logic"""
+                          retries: int = 3, fatal: bool = True,
+                          etag_file: Optional[Path] = None) -> Optional[str]:
+    """Download file with progress bar and retry logic.
+
+    The SHA256 of the data is computed while it streams in, so callers get
+    the digest without re-reading the file. Returns the hex digest, or None
+    if the download failed and fatal is False.
+
+    If etag_file is given, the ETag of dest_path is kept there and sent as
+    If-None-Match; a 304 response leaves the existing file untouched.
+
+    A retry after a broken transfer asks for the rest with a Range request
+    and keeps hashing from where it stopped; a server that answers 200
+    instead of 206 gets a fresh download.
+    """
+    import requests
+    
+    headers = {}
+    if etag_file and etag_file.exists() and dest_path.exists():
+        headers["If-None-Match"] = etag_file.read_text().strip()
+    
+    h = hashlib.sha256()
+    downloaded = 0  # bytes written to dest_path and fed to h
+    validator = None  # ETag/Last-Modified of the body being resumed
+    
     for attempt in range(1, retries + 1):
+        if downloaded:
+            headers.pop("If-None-Match", None)
+            headers["Range"] = f"bytes={downloaded}-"
+            if validator:
+                # Only resume if the file hasn't changed on the server
+                headers["If-Range"] = validator
+        else:
+            # Starting over (e.g. after a bad Content-Range): ask for everything
+            headers.pop("Range", None)
+            headers.pop("If-Range", None)
+        
         try:
-            r = requests.get(url, stream=True, timeout=60, headers={
-                "User-Agent": "Cursor-Installer/1.5"
-            })
+            # Connection errors and RETRY_STATUS are already retried by the session
+            r = get_session().get(url, stream=True, timeout=60, headers=headers)
             r.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            warn(f"{desc} failed: {e}")
+            if fatal:
+                err("Failed to download.")
+            return None
+        
+        try:
+            if r.status_code == 304:
+                log(f"{desc}: not modified")
+                return sha256sum(dest_path)
+            
+            if r.status_code == 206:
+                if not r.headers.get("Content-Range", "").startswith(f"bytes {downloaded}-"):
+                    downloaded, h = 0, hashlib.sha256()
+                    raise ValueError(f"unexpected Content-Range {r.headers.get('Content-Range')}")
+                log(f"{desc}: resuming at byte {downloaded}")
+            else:
+                # Full body: first attempt, or the server ignored our Range
+                downloaded, h = 0, hashlib.sha256()
+                etag = r.headers.get("ETag")
+                validator = etag if etag and not etag.startswith("W/") else r.headers.get("Last-Modified")
             
-            total = int(r.headers.get("content-length", 0))
-            downloaded = 0
+            total = downloaded + int(r.headers.get("content-length", 0))
+            last_percent = -1
             
-            with open(dest_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
+            with open(dest_path, "ab") as f:
+                # Drop anything past the last chunk we hashed
+                f.truncate(downloaded)
+                # Read straight from urllib3, skipping iter_content's wrapper generator
+                for chunk in r.raw.stream(_DOWNLOAD_CHUNK, decode_content=True):
                     if chunk:
                         f.write(chunk)
+                        h.update(chunk)
                         downloaded += len(chunk)
                         if total > 0:
                             percent = (downloaded * 100) // total
-                            print(f"\r{desc}: {percent}%", end="", flush=True)
+                            # Only redraw when the number actually changes
+                            if percent != last_percent:
+                                print(f"\r{desc}: {percent}%", end="", flush=True)
+                                last_percent = percent
             
             print("")  # New line after progress
-            return True
+            if etag_file:
+                etag = r.headers.get("ETag")
+                if etag:
+                    etag_file.write_text(etag)
+                elif etag_file.exists():
+                    etag_file.unlink()
+            return h.hexdigest()
             
         except Exception as e:
-            warn(f"{desc} failed (attempt {attempt}/{retries}): {e}")
-            if attempt == retries and fatal:
-                err(f"Failed to download after {retries} attempts.")
-            elif attempt == retries:
-                return False
-            time.sleep(2)
+            # The adapter can't retry a body that breaks off mid-stream
+            warn(f"{desc} interrupted (attempt {attempt}/{retries}): {e}")
+            if attempt == retries:
+                if fatal:
+                    err(f"Failed to download after {attempt} attempts.")
+                return None
+            time.sleep(backoff_delay(attempt))
     
-    return False
+    return None
+
+def remote_matches_local(url: str) -> bool:
+    """HEAD url and compare its Content-Length and ETag with the installed AppImage"""
+    if not BIN_ETAG.exists():
+        return False
+    
+    import requests
+    
+    try:
+        local_etag = BIN_ETAG.read_text().strip()
+        # A weak ETag only promises equivalent content, not identical bytes
+        if local_etag.startswith("W/"):
+            return False
+        r = get_session().head(url, allow_redirects=True, timeout=10)
+        r.raise_for_status()
+        etag = r.headers.get("ETag")
+        length = int(r.headers.get("Content-Length", -1))
+        return (etag is not None and not etag.startswith("W/") and etag == local_etag
+                and length == BIN_PATH.stat().st_size)
+    except (requests.exceptions.RequestException, ValueError, OSError):
+        return False
 
 def is_update_needed(url: str, latest_version: str, expected_sha256: Optional[str] = None) -> bool:
     """Check if an update is needed by comparing versions and checksums"""
@@ -216,41 +448,89 @@ def is_update_needed(url: str, latest_version: str, expected_sha256: Optional[st
             log(f"Already up to date (version {latest_version}).")
             return False
     
-    # If we have a checksum, verify it
-    if expected_sha256:
-        local_hash = sha256sum(BIN_PATH)
-        if local_hash == expected_sha256:
-            VERSION_FILE.write_text(latest_version)
-            log(f"File integrity verified (version {latest_version}).")
-            return False
+    # The API rarely ships a checksum; a HEAD costs one round trip, not ~150 MB
+    if remote_matches_local(url):
+        VERSION_FILE.write_text(latest_version)
+        log(f"Installed AppImage matches the download (version {latest_version}).")
+        return False
+    
+    # Without a reference checksum there is nothing to compare a hash against
+    if not expected_sha256:
+        return True
+    
+    # Last resort: the version file is missing or stale, so check the bytes
+    if cached_sha256sum(BIN_PATH) == expected_sha256:
+        VERSION_FILE.write_text(latest_version)
+        log(f"File integrity verified (version {latest_version}).")
+        return False
     
     return True
 
 def close_other_instances() -> None:
     """Safely close running instances of Cursor"""
     log("Closing running instances of Cursor...")
+    target = str(BIN_PATH).encode()
+    uid = os.getuid()
+    skip = {os.getpid(), os.getppid()}
+    killed = 0
+    
     try:
-        # Use pkill with user filter for safety
-        subprocess.run(
-            ["pkill", "-u", os.getlogin(), "-f", str(BIN_PATH)],
-            check=False, capture_output=True
-        )
-        time.sleep(1)
+        # Walk /proc directly rather than forking pkill; only our own processes
+        for proc in Path("/proc").iterdir():
+            if not proc.name.isdigit() or int(proc.name) in skip:
+                continue
+            try:
+                cmdline = proc.joinpath("cmdline")
+                if cmdline.stat().st_uid == uid and target in cmdline.read_bytes():
+                    os.kill(int(proc.name), signal.SIGTERM)
+                    killed += 1
+            except OSError:
+                continue  # Exited while we looked, or not ours to read
+        
+        if killed:
+            time.sleep(1)
     except Exception as e:
         warn(f"Failed to close instances: {e}")
 
+def replace_file(src: Path, dst: Path) -> None:
+    """os.replace src over dst, falling back to an in-kernel copy across filesystems"""
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    
+    # Copy next to dst with sendfile (no user-space buffers), then swap it in
+    staged = dst.with_name(dst.name + ".tmp")
+    with open(src, "rb") as fsrc, open(staged, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+            if not sent:
+                raise OSError(f"sendfile stopped at {offset} of {size} bytes")
+            offset += sent
+    os.chmod(staged, os.stat(src).st_mode & 0o777)
+    os.replace(staged, dst)
+    src.unlink()
+
 def download_and_install(url: str, version: str, expected_sha256: Optional[str] = None) -> None:
     """Download and install the AppImage with integrity verification"""
-    with tempfile.TemporaryDirectory() as tmp:
+    # Stage on the same filesystem as BIN_PATH so the install is a rename, not a copy
+    ensure_install_dir()
+    with tempfile.TemporaryDirectory(dir=INSTALL_DIR.parent) as tmp:
         tmpfile = Path(tmp) / "cursor.AppImage"
+        tmp_etag = Path(tmp) / BIN_ETAG.name
         log(f"Downloading version {version}...")
         
-        if not download_with_progress(url, tmpfile, desc="Downloading AppImage"):
+        file_hash = download_with_progress(url, tmpfile, desc="Downloading AppImage",
+                                           etag_file=tmp_etag)
+        if not file_hash:
             err("Download failed.")
         
-        # Verify file integrity
+        # Verify file integrity (hash was computed during the download)
         log("Verifying downloaded file integrity...")
-        file_hash = sha256sum(tmpfile)
         if expected_sha256 and file_hash != expected_sha256:
             err("Checksum mismatch! Aborting installation.")
         elif not expected_sha256:
@@ -258,31 +538,77 @@ def download_and_install(url: str, version: str, expected_sha256: Optional[str]
         
         # Install the file
         try:
-            INSTALL_DIR.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(tmpfile), BIN_PATH)
-            os.chmod(BIN_PATH, 0o755)
+            os.chmod(tmpfile, 0o755)
+            replace_file(tmpfile, BIN_PATH)
+            write_hash_cache(BIN_PATH, file_hash)
+            # Keep the ETag only alongside the binary it describes
+            if tmp_etag.exists():
+                os.replace(tmp_etag, BIN_ETAG)
+            elif BIN_ETAG.exists():
+                BIN_ETAG.unlink()
             VERSION_FILE.write_text(version)
             log(f"AppImage installed to {BIN_PATH}")
         except Exception as e:
             err(f"Failed to install AppImage: {e}")
 
+def probe_icon_url(url: str) -> Optional[str]:
+    """Return url if a HEAD request for it answers 200"""
+    import requests
+    
+    try:
+        # Not the shared session: its adapter retries would stretch a dead
+        # URL's probe well past the 5s timeout
+        r = requests.head(url, timeout=5, allow_redirects=True, headers={
+            "User-Agent": "Cursor-Installer/1.5"
+        })
+        return url if r.status_code == 200 else None
+    except requests.exceptions.RequestException:
+        return None
+
+def reachable_icon_urls() -> List[str]:
+    """Probe all ICON_URLS concurrently; return those that are up, in preference order"""
+    # Probes don't retry, so this takes at most one 5s timeout
+    with ThreadPoolExecutor(max_workers=len(ICON_URLS)) as ex:
+        return [url for url in ex.map(probe_icon_url, ICON_URLS) if url]
+
+def icon_etag_path(url: str) -> Path:
+    """ETag sidecar for ICON_PATH as served by url"""
+    key = hashlib.sha256(url.encode()).hexdigest()[:12]
+    return INSTALL_DIR / f"cursor.png.{key}.etag"
+
+def clear_icon_etags(keep: Optional[Path] = None) -> None:
+    """Remove icon ETag sidecars other than keep"""
+    for path in INSTALL_DIR.glob("cursor.png*.etag"):
+        if path != keep:
+            path.unlink()
+
 def install_icon() -> None:
     """Download and install application icon"""
     log("Installing application icon...")
-    INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_install_dir()
     
-    for url in ICON_URLS:
+    for url in reachable_icon_urls():
+        # An ETag is only meaningful to the URL that issued it; once another
+        # URL is used, the icon on disk no longer matches any stored ETag
+        etag_file = icon_etag_path(url)
+        clear_icon_etags(keep=etag_file)
         if download_with_progress(url, ICON_PATH, 
-                                desc=f"Downloading icon from {url}", 
-                                fatal=False):
+                                  desc=f"Downloading icon from {url}", 
+                                  fatal=False, etag_file=etag_file):
             log(f"Icon saved to {ICON_PATH}")
             return
     
     # Create placeholder icon if all downloads fail
     warn("All icon downloads failed. Creating placeholder icon...")
+    clear_icon_etags()
     try:
         from PIL import Image, ImageDraw, ImageFont
-        
+    except ImportError:
+        warn("Pillow not installed; run 'pip3 install --user Pillow' for a placeholder icon.")
+        ICON_PATH.write_bytes(b"")
+        return
+    
+    try:
         # Create a simple placeholder icon
         img = Image.new("RGBA", (128, 128), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
@@ -323,9 +649,11 @@ MimeType=text/plain;inode/directory;application/x-code-workspace;
         
         DESKTOP_FILE.write_text(desktop_content)
         
-        # Update desktop database
-        subprocess.run(["update-desktop-database", str(DESKTOP_FILE.parent)], 
-                      check=False, capture_output=True)
+        # Desktop environments watch the per-user applications directory, so
+        # rebuilding the MIME cache is opt-in for those that don't
+        if os.environ.get("CURSOR_INSTALLER_REFRESH_DESKTOP") == "1":
+            subprocess.run(["update-desktop-database", str(DESKTOP_FILE.parent)], 
+                          check=False, capture_output=True)
         
         log(f"Desktop entry created at {DESKTOP_FILE}")
     except Exception as e:
@@ -346,28 +674,46 @@ def launch() -> None:
 
 def main() -> None:
     """Main installation function"""
+    parser = argparse.ArgumentParser(description="Install or update Cursor as an AppImage.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ignore the cached API response and query cursor.com")
+    args = parser.parse_args()
+    
     log(f"Cursor AppImage Installer v{APP_VERSION}")
     log("=" * 50)
     
     try:
         # System checks
         check_system_requirements()
+        
+        # The API lookup imports requests, so dependencies must be in place
+        # first (a find_spec check when they already are)
         install_deps()
-        set_libgl_env()
+        
+        # The .profile edit and the API lookup are independent, so overlap
+        # them; result() re-raises any err() exit
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            env = ex.submit(set_libgl_env)
+            info = ex.submit(fetch_download_info, use_cache=not args.no_cache)
+            env.result()
+            url, latest_version, expected_sha256 = info.result()
         
         # Close existing instances
         close_other_instances()
         
-        # Fetch and install
-        url, latest_version, expected_sha256 = fetch_download_info()
-        
+        # Install if needed
         if not is_update_needed(url, latest_version, expected_sha256):
             launch()
             return
         
         download_and_install(url, latest_version, expected_sha256)
-        install_icon()
-        create_desktop_entry()
+        
+        # The icon download and desktop entry don't depend on each other
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            icon = ex.submit(install_icon)
+            desktop = ex.submit(create_desktop_entry)
+            icon.result()
+            desktop.result()
         
         log(f"Installation of version {latest_version} complete!")
         log("=" * 50)
@@ -0,0 +1,625 @@
+"""
+Shared implementation behind install_cursor_appimage_v10/v11/v13/v14.
+
+Those scripts only differ in where Cursor is installed, which icon URLs are
+tried and how system dependencies are handled; each one builds an
+InstallerConfig and calls main(config).
+"""
+import os
+import sys
+import select
+import site
+import signal
+import subprocess
+import requests
+import tempfile
+import hashlib
+import importlib.util
+import mmap
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+APP_NAME = "Cursor"
+
+API_URL = "https://www.cursor.com/api/download?platform=linux-x64&releaseTrack=stable"
+GITHUB_ICON_URL = "https://raw.githubusercontent.com/getcursor/cursor/main/resources/icon.png"
+DEPENDENCIES = ["fuse-libs", "curl", "jq", "desktop-file-utils"]
+CHUNK_SIZE = 1 << 20  # 1 MiB per iter_content step
+MMAP_WINDOW = 64 << 20  # bytes mapped at a time by sha256sum
+NATIVE_HASH_THRESHOLD = 100 << 20  # above this, sha256sum shells out to coreutils
+PARALLEL_CONNECTIONS = 4
+
+# One pooled session for every request so cursor.com and the CDN are only
+# handshaked once; urllib3 retries failed connects and 502/503/504 responses.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+@dataclass(frozen=True)
+class InstallerConfig:
+    install_dir: Path
+    user_install: bool = True
+    icon_urls: Tuple[str, ...] = (GITHUB_ICON_URL,)
+    use_dnf: bool = False  # check/install DEPENDENCIES with rpm + dnf (system installs only)
+    placeholder_icon: bool = False  # draw an icon with Pillow if every URL fails
+    process_pattern: Optional[str] = None  # pgrep -f pattern for running instances; default bin_path
+    force_kill: bool = True  # SIGKILL instances that ignore SIGTERM, and abort if any survive
+
+    @property
+    def bin_path(self):
+        return self.install_dir / "cursor.AppImage"
+
+    @property
+    def instance_pattern(self):
+        return self.process_pattern or str(self.bin_path)
+
+    @property
+    def icon_path(self):
+        return self.install_dir / "cursor.png"
+
+    @property
+    def version_file(self):
+        return self.install_dir / ".version"
+
+    @property
+    def api_etag_file(self):
+        return self.install_dir / ".api_etag"
+
+    @property
+    def api_lastmod_file(self):
+        return self.install_dir / ".api_lastmod"
+
+    @property
+    def desktop_file(self):
+        if self.user_install:
+            return Path.home() / ".local/share/applications/cursor.desktop"
+        return Path("/usr/share/applications") / "cursor.desktop"
+
+    @property
+    def env_file(self):
+        return Path.home() / ".profile" if self.user_install else Path("/etc/environment")
+
+def log(msg):
+    print(f"\033[1;32m[INFO]\033[0m {msg}")
+
+def warn(msg):
+    print(f"\033[1;33m[WARN]\033[0m {msg}")
+
+def err(msg):
+    sys.stderr.write(f"\033[1;31m[ERROR]\033[0m {msg}\n")
+    sys.exit(1)
+
+def require_root(config):
+    if not config.user_install and os.geteuid() != 0:
+        err("Run as root (sudo) or use a user-install version of this script.")
+
+def check_hash_backend():
+    # Only OpenSSL's sha256 uses the SHA-NI/AVX2 code paths; CPython's builtin
+    # fallback is several times slower on a full AppImage.
+    if type(hashlib.sha256()).__module__ != "_hashlib":
+        warn("hashlib is not backed by OpenSSL; checksum verification will be slow.")
+
+def install_deps(config):
+    if not config.use_dnf:
+        return
+    if config.user_install:
+        log("User install mode: skipping dependency installation.")
+        return
+    log("Checking dependencies...")
+    # One rpm invocation (one RPM DB open) for all packages; rpm reports each
+    # absent one as "package <name> is not installed" on stdout.
+    res = subprocess.run(["rpm", "-q", *DEPENDENCIES], capture_output=True, text=True)
+    missing = [dep for dep in DEPENDENCIES if f"package {dep} is not installed" in res.stdout]
+    if not missing:
+        log("All dependencies already installed.")
+        return
+    log(f"Installing missing dependencies: {', '.join(missing)}")
+    subprocess.run(["dnf", "install", "-y", *missing], check=True)
+
+def ensure_pillow():
+    # Pillow is only needed for the placeholder icon, i.e. when every icon URL
+    # failed, so it is checked (and installed) there rather than at startup.
+    # find_spec only locates the package; it does not execute PIL's import.
+    if importlib.util.find_spec("PIL") is not None:
+        return
+    log("Pillow not found. Installing with pip --user...")
+    # Pillow ships self-contained wheels, so skip the resolver and sdist builds.
+    subprocess.run([sys.executable, "-m", "pip", "install", "--user", "--no-deps",
+                    "--only-binary=:all:", "--disable-pip-version-check", "--no-input",
+                    "Pillow"], check=True)
+    # The user site dir isn't on sys.path if it didn't exist at startup
+    site.addsitedir(site.getusersitepackages())
+    importlib.invalidate_caches()
+    if importlib.util.find_spec("PIL") is None:
+        raise ImportError("Pillow installation failed")
+    log("Pillow installed successfully.")
+
+def set_libgl_env(config):
+    log("Ensuring LIBGL_ALWAYS_SOFTWARE=1 is set...")
+    env_file = config.env_file
+    if env_file.exists():
+        with open(env_file) as f:
+            if any("LIBGL_ALWAYS_SOFTWARE" in ln for ln in f):
+                log(f"Environment variable already present in {env_file}")
+                return
+    with open(env_file, "a") as f:
+        f.write("\nLIBGL_ALWAYS_SOFTWARE=1\n")
+    log(f"Added LIBGL_ALWAYS_SOFTWARE=1 to {env_file}")
+    if config.user_install:
+        warn("You must log out or run: source ~/.profile for the change to take effect.")
+
+def fetch_download_info(config):
+    # Returns None when the API answers 304: nothing changed since the response
+    # whose validators were saved after the last successful install/check.
+    log("Fetching latest AppImage info...")
+    headers = {"Accept": "application/json"}
+    if config.bin_path.exists():
+        if config.api_etag_file.exists():
+            headers["If-None-Match"] = config.api_etag_file.read_text().strip()
+        if config.api_lastmod_file.exists():
+            headers["If-Modified-Since"] = config.api_lastmod_file.read_text().strip()
+    try:
+        r = SESSION.get(API_URL, headers=headers, timeout=15)
+        r.raise_for_status()
+    except Exception as e:
+        err(f"Failed to fetch API data: {e}")
+    if r.status_code == 304:
+        return None
+    data = r.json()
+    dl = data.get("downloadUrl")
+    ver = data.get("version") or "unknown"
+    sha256 = data.get("sha256")
+    if not dl:
+        err("downloadUrl not found in API response.")
+    # ETag / Last-Modified of this response, for save_api_validators
+    validators = (r.headers.get("ETag"), r.headers.get("Last-Modified"))
+    return dl, ver, sha256, validators
+
+def save_api_validators(config, validators):
+    # Only called once bin_path is known to match the API response, so a later
+    # 304 really means "installed version is current".
+    etag, lastmod = validators
+    for path, value in ((config.api_etag_file, etag),
+                        (config.api_lastmod_file, lastmod)):
+        if value:
+            path.write_text(value)
+        else:
+            path.unlink(missing_ok=True)
+
+def sha256sum(path):
+    # Large files go to coreutils' sha256sum, which hashes entirely in native
+    # code; below the threshold the process spawn would cost more than it saves.
+    if os.path.getsize(path) > NATIVE_HASH_THRESHOLD:
+        try:
+            res = subprocess.run(["sha256sum", str(path)], capture_output=True, text=True, check=True)
+            return res.stdout.split()[0]
+        except (OSError, subprocess.CalledProcessError, IndexError):
+            pass
+    # Hash through read-only mmap windows: OpenSSL sees one large buffer per
+    # window instead of thousands of read() copies, and the kernel reads ahead.
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        for offset in range(0, size, MMAP_WINDOW):
+            length = min(MMAP_WINDOW, size - offset)
+            with mmap.mmap(f.fileno(), length, offset=offset, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                h.update(mm)
+    return h.hexdigest()
+
+def _write_chunks(q, f, h, state):
+    # Consumer side of download_with_progress: writes and hashes chunks while
+    # the main thread keeps reading from the socket. Both write() and OpenSSL's
+    # sha256 release the GIL, so the two threads genuinely overlap.
+    try:
+        while (chunk := q.get()) is not None:
+            f.write(chunk)
+            if h is not None:
+                h.update(chunk)
+            state["written"] += len(chunk)
+    except Exception as e:
+        state["error"] = e
+        while q.get() is not None:  # keep draining so the producer never blocks
+            pass
+
+def _range_validator(r):
+    # If-Range needs a strong validator: a weak ETag only promises equivalent
+    # content, so fall back to Last-Modified (or None: don't combine ranges).
+    etag = r.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return r.headers.get("Last-Modified")
+
+def download_with_progress(url, dest_path, desc="Downloading", retries=3, fatal=True, hasher=None):
+    # When a hasher is given, bytes are hashed as they arrive and the hex digest
+    # is returned instead of True, so callers never have to re-read the file.
+    # Retries resume from the bytes already on disk using an HTTP Range request,
+    # pinned with If-Range to the object the first bytes came from.
+    h = None
+    downloaded = 0
+    validator = None
+    for attempt in range(1, retries + 1):
+        try:
+            start = dest_path.stat().st_size if attempt > 1 and dest_path.exists() else 0
+            if hasher is not None and start != downloaded:
+                start = 0  # hash state does not match the partial file; start over
+            if not validator:
+                start = 0  # nothing to pin the resumed bytes to
+            headers = {"Range": f"bytes={start}-", "If-Range": validator} if start else {}
+            r = SESSION.get(url, stream=True, timeout=60, headers=headers)
+            if r.status_code == 416 or (r.status_code == 206 and not
+                    r.headers.get("Content-Range", "").startswith(f"bytes {start}-")):
+                r.close()
+                start = 0
+                r = SESSION.get(url, stream=True, timeout=60)
+            r.raise_for_status()
+            if r.status_code != 206:
+                start = 0
+                validator = _range_validator(r)
+            total = int(r.headers.get("content-length", 0))
+            if total > 0:
+                total += start
+            received = start
+            if hasher is not None and start == 0:
+                h = hasher.copy()
+            state = {"written": 0, "error": None}
+            with open(dest_path, "ab" if start else "wb") as f:
+                if not start and total > 0 and hasattr(os, "posix_fallocate"):
+                    # Reserve the whole file up front: contiguous extents and
+                    # no allocator work per write. Trimmed back below if short.
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, total)
+                    except OSError:
+                        pass
+                q = queue.Queue(maxsize=4)
+                writer = threading.Thread(target=_write_chunks, args=(q, f, h, state), daemon=True)
+                writer.start()
+                try:
+                    for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                        if state["error"]:
+                            break
+                        if chunk:
+                            q.put(chunk)
+                            received += len(chunk)
+                            if total > 0:
+                                percent = received * 100 // total
+                                print(f"\r{desc}: {percent}%", end="", flush=True)
+                finally:
+                    q.put(None)
+                    writer.join()
+                    downloaded = start + state["written"]
+                    f.truncate(downloaded)
+            if state["error"]:
+                raise state["error"]
+            print("")
+            return h.hexdigest() if h is not None else True
+        except Exception as e:
+            warn(f"{desc} failed (attempt {attempt}/{retries}): {e}")
+            if attempt == retries and fatal:
+                err(f"Failed to download after {retries} attempts.")
+            elif attempt == retries:
+                return False
+            time.sleep(2)
+
+def parallel_download(url, dest_path, desc="Downloading", connections=PARALLEL_CONNECTIONS):
+    # Split the file into byte ranges fetched over separate connections and
+    # written in place with pwrite. Returns False when the server does not
+    # advertise range support (or anything goes wrong) so the caller can fall
+    # back to the single-connection download_with_progress.
+    try:
+        head = SESSION.head(url, allow_redirects=True, timeout=15)
+        head.raise_for_status()
+    except Exception as e:
+        warn(f"{desc}: HEAD request failed ({e}); using a single connection.")
+        return False
+    size = int(head.headers.get("content-length", 0))
+    if head.headers.get("accept-ranges", "").lower() != "bytes" or size < connections * CHUNK_SIZE:
+        return False
+    # Every range must come from the object the HEAD described; without a
+    # validator to pin it, a change mid-download could splice two files.
+    validator = _range_validator(head)
+    if not validator:
+        return False
+
+    step = -(-size // connections)
+    ranges = [(lo, min(lo + step, size) - 1) for lo in range(0, size, step)]
+    lock = threading.Lock()
+    abort = threading.Event()
+    progress = {"done": 0}
+
+    def fetch_range(fd, lo, hi):
+        r = SESSION.get(head.url, headers={"Range": f"bytes={lo}-{hi}", "If-Range": validator},
+                        stream=True, timeout=60)
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise IOError("server ignored the Range header or the file changed")
+        content_range = r.headers.get("Content-Range", "")
+        if content_range != f"bytes {lo}-{hi}/{size}":
+            raise IOError(f"unexpected Content-Range {content_range!r} for bytes {lo}-{hi}")
+        offset = lo
+        for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+            if abort.is_set():
+                return
+            view = memoryview(chunk)
+            while view:
+                n = os.pwrite(fd, view, offset)
+                view = view[n:]
+                offset += n
+            with lock:
+                progress["done"] += len(chunk)
+                print(f"\r{desc}: {progress['done'] * 100 // size}%", end="", flush=True)
+        if offset != hi + 1:
+            raise IOError(f"short response for bytes {lo}-{hi}")
+
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+        with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+            futures = [ex.submit(fetch_range, fd, lo, hi) for lo, hi in ranges]
+            try:
+                for fut in futures:
+                    fut.result()
+            except Exception:
+                abort.set()
+                raise
+    except Exception as e:
+        print("")
+        warn(f"{desc}: parallel download failed ({e}); using a single connection.")
+        return False
+    finally:
+        os.close(fd)
+    print("")
+    return True
+
+def download_and_hash(url, dest_path, desc="Downloading"):
+    # Ranges arrive out of order, so a parallel download is hashed afterwards
+    # (from the page cache); the serial fallback hashes while streaming.
+    if parallel_download(url, dest_path, desc=desc):
+        return sha256sum(dest_path)
+    return download_with_progress(url, dest_path, desc=desc, hasher=hashlib.sha256())
+
+def is_update_needed(config, latest_version, expected_sha256=None):
+    if not config.bin_path.exists():
+        return True
+    if (config.version_file.exists() and latest_version != "unknown"
+            and config.version_file.read_text().strip() == latest_version):
+        return False
+    if expected_sha256 and sha256sum(config.bin_path) == expected_sha256:
+        config.version_file.write_text(latest_version)
+        return False
+    # Without an API checksum the answer is only known after downloading; see
+    # download_and_verify, which hashes the new AppImage in the same pass.
+    return True
+
+def _wait_for_exit(pidfds, timeout):
+    # Block in a single poll() until every pidfd becomes readable (its process
+    # exited) or the timeout expires; returns the pidfds still alive.
+    remaining = dict(pidfds)
+    poller = select.poll()
+    for fd in remaining:
+        poller.register(fd, select.POLLIN)
+    deadline = time.monotonic() + timeout
+    while remaining:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            break
+        for fd, _ in poller.poll(left * 1000):
+            poller.unregister(fd)
+            os.close(fd)
+            del remaining[fd]
+    return remaining
+
+def _ancestor_pids():
+    # This process and every ancestor (sudo, a wrapper script, a bash -c
+    # shell...): their command lines can match the pattern too, and killing
+    # them would take the installer down with them.
+    pids = set()
+    pid = os.getpid()
+    while pid > 1 and pid not in pids:
+        pids.add(pid)
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                pid = next(int(ln.split()[1]) for ln in f if ln.startswith("PPid:"))
+        except (OSError, StopIteration, ValueError):
+            break
+    pids.add(os.getppid())
+    return pids
+
+def _terminate_without_pidfd(pids):
+    # Fallback without pidfds (Python < 3.9, or a kernel older than 5.3):
+    # one SIGTERM each, then give them a moment to exit.
+    signalled = False
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            signalled = True
+        except OSError:  # already gone, or not ours to signal
+            pass
+    if signalled:
+        time.sleep(1)
+
+def close_other_instances(config):
+    # User installs only touch this user's processes; a system install (run
+    # as root) closes every user's instance of the shared AppImage.
+    owner = ["-U", str(os.getuid())] if config.user_install else []
+    if config.user_install:
+        log("Closing running instances of Cursor owned by this user...")
+    else:
+        log("Closing any running instances of Cursor (multi-user)...")
+    ps = subprocess.run(["pgrep", *owner, "-f", config.instance_pattern], capture_output=True, text=True)
+    skip = _ancestor_pids()
+    pids = [pid for pid in (int(p) for p in ps.stdout.split()) if pid not in skip]
+    if not hasattr(os, "pidfd_open"):  # Python < 3.9
+        _terminate_without_pidfd(pids)
+        return
+    pidfds = {}
+    for pid in pids:
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            continue
+        except OSError:
+            # ENOSYS: Python has pidfd_open but the kernel (< 5.3, e.g. EL8) doesn't
+            for fd in pidfds:
+                os.close(fd)
+            _terminate_without_pidfd(pids)
+            return
+        try:
+            signal.pidfd_send_signal(fd, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        pidfds[fd] = pid
+    if not pidfds:
+        return
+    if not config.force_kill:
+        # SIGTERM only: a broad pattern can match unrelated processes, which
+        # must never be SIGKILLed or block the install
+        remaining = _wait_for_exit(pidfds, 1)
+        for fd in remaining:
+            os.close(fd)
+        if remaining:
+            warn(f"{len(remaining)} matching process(es) still running; leaving them alone.")
+        return
+    remaining = _wait_for_exit(pidfds, 5)
+    if not remaining:
+        log("All Cursor instances terminated.")
+        return
+    for fd, pid in remaining.items():
+        log(f"Force killing PID {pid} with SIGKILL")
+        try:
+            signal.pidfd_send_signal(fd, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    remaining = _wait_for_exit(remaining, 2)
+    if remaining:
+        for fd in remaining:
+            os.close(fd)
+        err("Unable to terminate all running Cursor instances. Close them manually and retry.")
+    log("All Cursor instances forcefully terminated.")
+
+def download_and_verify(config, url, expected_sha256=None):
+    # Keep the temp file next to bin_path so installing it is a rename, not a
+    # copy across filesystems (/tmp is often tmpfs).
+    config.install_dir.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(prefix=".cursor-", suffix=".AppImage", dir=config.install_dir)
+    os.close(fd)
+    tmp_path = Path(name)
+    try:
+        log(f"Downloading from: {url}")
+        file_hash = download_and_hash(url, tmp_path, desc="Downloading AppImage")
+        log("Verifying downloaded file integrity...")
+        if expected_sha256 and file_hash != expected_sha256:
+            err("Checksum mismatch! Aborting installation.")
+        elif not expected_sha256:
+            log("No checksum from API; skipping verification.")
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path, file_hash
+
+def install_appimage(config, tmp_path, version):
+    os.chmod(tmp_path, 0o755)
+    os.replace(tmp_path, config.bin_path)
+    config.version_file.write_text(version)
+
+def install_icon(config):
+    log("Attempting to download icon...")
+    icon_path = config.icon_path
+    config.install_dir.mkdir(parents=True, exist_ok=True)
+    for url in config.icon_urls:
+        if download_with_progress(url, icon_path, desc=f"Downloading icon from {url}", fatal=False):
+            log(f"Icon saved to {icon_path}")
+            return
+    if not config.placeholder_icon:
+        warn("Could not download icon; proceeding without it.")
+        return
+    warn("All icon downloads failed. Creating placeholder icon...")
+    try:
+        ensure_pillow()
+        from PIL import Image, ImageDraw
+        img = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, 31, 31], fill=(80, 80, 80))
+        draw.text((8, 8), "C", fill=(255, 255, 255))
+        img.save(icon_path)
+        log(f"Placeholder icon created at {icon_path}")
+    except Exception as e:
+        warn(f"Placeholder icon creation failed: {e}")
+        icon_path.write_text("")
+
+def create_desktop_entry(config):
+    log("Creating desktop entry...")
+    exec_line = f"{config.bin_path} --no-sandbox --disable-gpu"
+    desktop_file = config.desktop_file
+    desktop_file.parent.mkdir(parents=True, exist_ok=True)
+    desktop_file.write_text(f"""[Desktop Entry]
+Name={APP_NAME}
+Exec={exec_line}
+Icon={config.icon_path}
+Type=Application
+Categories=Development;IDE;
+""")
+    if not config.user_install:
+        os.chmod(desktop_file, 0o644)
+    # Refreshing the index only matters to later sessions; don't make launch() wait.
+    try:
+        subprocess.Popen(["update-desktop-database", str(desktop_file.parent)],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         start_new_session=True)
+    except OSError:
+        warn("update-desktop-database not available; skipping desktop database refresh.")
+
+def launch(config):
+    log(f"Launching {APP_NAME} with GPU disabled...")
+    subprocess.Popen([str(config.bin_path), "--no-sandbox", "--disable-gpu"])
+
+def main(config):
+    require_root(config)
+    check_hash_backend()
+    install_deps(config)
+    # Only close_other_instances has to finish before installing; the API
+    # round-trip and the env file check overlap with it.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_api = ex.submit(fetch_download_info, config)
+        fut_env = ex.submit(set_libgl_env, config)
+        close_other_instances(config)
+        fut_env.result()
+        info = fut_api.result()
+    if info is None:
+        log("API response unchanged since the last check; already up to date.")
+        launch(config)
+        sys.exit(0)
+    url, latest_version, expected_sha256, validators = info
+    if not is_update_needed(config, latest_version, expected_sha256):
+        save_api_validators(config, validators)
+        log(f"Already up to date (version {latest_version}).")
+        launch(config)
+        sys.exit(0)
+    tmp_path, file_hash = download_and_verify(config, url, expected_sha256)
+    bin_path = config.bin_path
+    if not expected_sha256 and bin_path.exists() and sha256sum(bin_path) == file_hash:
+        tmp_path.unlink()
+        config.version_file.write_text(latest_version)
+        save_api_validators(config, validators)
+        log(f"Already up to date (version {latest_version}).")
+        launch(config)
+        sys.exit(0)
+    log(f"Installing version {latest_version}...")
+    install_appimage(config, tmp_path, latest_version)
+    save_api_validators(config, validators)
+    install_icon(config)
+    create_desktop_entry(config)
+    log(f"Installation of version {latest_version} complete.")
+    launch(config)
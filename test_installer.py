@@ -6,22 +6,95 @@ This script tests the installer functionality without actually installing.
 
 import sys
 import os
+import re
 import tempfile
 import json
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def serve_bytes(data, ranges=True, break_first_at=None, misreport_range=False, etag='"v1"'):
+    """Serve data from a localhost HTTP server; returns (server, url, requests_seen).
+
+    requests_seen lists each GET's Range header; server.if_ranges lists the
+    If-Range headers. A Range whose If-Range doesn't match etag gets a full
+    200 reply. With break_first_at, the first GET is cut off after that many
+    bytes. With misreport_range, the first ranged reply claims to start one
+    byte late. Stop the server with server.shutdown().
+    """
+    seen = []
+    if_ranges = []
+    misreported = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+        
+        def wants_range(self):
+            if_range = self.headers.get("If-Range")
+            return bool(ranges and self.headers.get("Range")
+                        and (if_range is None or if_range == etag))
+        
+        def send_body_headers(self, start, end):
+            partial = self.wants_range()
+            self.send_response(206 if partial else 200)
+            if ranges:
+                self.send_header("Accept-Ranges", "bytes")
+            if etag:
+                self.send_header("ETag", etag)
+            if partial:
+                claimed = start
+                if misreport_range and not misreported:
+                    misreported.append(start)
+                    claimed = start + 1
+                self.send_header("Content-Range", f"bytes {claimed}-{end}/{len(data)}")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+        
+        def byte_range(self):
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+            if not (self.wants_range() and match):
+                return 0, len(data) - 1
+            return int(match.group(1)), int(match.group(2) or len(data) - 1)
+        
+        def do_HEAD(self):
+            self.send_body_headers(0, len(data) - 1)
+        
+        def do_GET(self):
+            seen.append(self.headers.get("Range"))
+            if_ranges.append(self.headers.get("If-Range"))
+            start, end = self.byte_range()
+            self.send_body_headers(start, end)
+            body = data[start:end + 1]
+            if break_first_at is not None and len(seen) == 1:
+                body = body[:break_first_at]
+            self.wfile.write(body)
+    
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    server.if_ranges = if_ranges
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/cursor.AppImage", seen
+
 def test_api_connection():
     """Test API connection and response parsing"""
     print("Testing API connection...")
     
     try:
-        import requests
-        from install_cursor_appimage_v15 import fetch_download_info
+        import install_cursor_appimage_v15 as installer
         
-        url, version, checksum = fetch_download_info()
+        # Keep the real ~/Applications/cursor (and its cache) out of the test
+        original = (installer.INSTALL_DIR, installer.API_CACHE)
+        with tempfile.TemporaryDirectory() as tmp:
+            installer.INSTALL_DIR = Path(tmp)
+            installer.API_CACHE = Path(tmp) / ".api_cache.json"
+            try:
+                url, version, checksum = installer.fetch_download_info(use_cache=False)
+            finally:
+                installer.INSTALL_DIR, installer.API_CACHE = original
         print(f"✓ API connection successful")
         print(f"  Download URL: {url}")
         print(f"  Version: {version}")
@@ -57,6 +130,36 @@ def test_system_requirements():
         print(f"✗ System requirements check failed: {e}")
         return False
 
+def test_api_cache():
+    """Test that a fresh cached API response is used without a network call"""
+    print("\nTesting API cache...")
+    
+    try:
+        import time
+        import install_cursor_appimage_v15 as installer
+        
+        original_cache = installer.API_CACHE
+        with tempfile.TemporaryDirectory() as tmp:
+            installer.API_CACHE = Path(tmp) / ".api_cache.json"
+            try:
+                installer.API_CACHE.write_text(json.dumps({
+                    "url": "https://example.invalid/Cursor.AppImage",
+                    "version": "9.9.9",
+                    "fetched_at": time.time(),
+                }))
+                url, version, _ = installer.fetch_download_info()
+            finally:
+                installer.API_CACHE = original_cache
+        
+        if url == "https://example.invalid/Cursor.AppImage" and version == "9.9.9":
+            print("✓ API cache successful")
+            return True
+        print(f"✗ API cache failed: got {url}, {version}")
+        return False
+    except Exception as e:
+        print(f"✗ API cache failed: {e}")
+        return False
+
 def test_sha256_function():
     """Test SHA256 calculation"""
     print("\nTesting SHA256 calculation...")
@@ -115,6 +218,382 @@ def test_download_function():
         print(f"✗ Download functionality failed: {e}")
         return False
 
+def test_download_resume():
+    """Test that an interrupted download resumes, and restarts on a bad Content-Range"""
+    print("\nTesting download resume...")
+    
+    try:
+        import install_cursor_appimage_v15 as installer
+        
+        chunk = installer._DOWNLOAD_CHUNK
+        data = os.urandom(3 * chunk + 17)
+        expected = hashlib.sha256(data).hexdigest()
+        results = []
+        original_delay = installer.backoff_delay
+        installer.backoff_delay = lambda attempt: 0
+        try:
+            for misreport in (False, True):
+                server, url, seen = serve_bytes(data, break_first_at=chunk + 5,
+                                                misreport_range=misreport)
+                try:
+                    with tempfile.TemporaryDirectory() as tmp:
+                        path = Path(tmp) / "cursor.AppImage"
+                        digest = installer.download_with_progress(url, path, "Test download",
+                                                                  fatal=False)
+                        content = path.read_bytes()
+                finally:
+                    server.shutdown()
+                results.append((seen, server.if_ranges, content == data and digest == expected))
+        finally:
+            installer.backoff_delay = original_delay
+        
+        (seen, if_ranges, ok), (bad_seen, _, bad_ok) = results
+        # The first full chunk was kept and hashed, so only the rest is fetched
+        resumed = seen == [None, f"bytes={chunk}-"] and if_ranges[1] == '"v1"'
+        # Full GET (broken), ranged GET (misreported), then a full GET again
+        restarted = len(bad_seen) == 3 and bad_seen[1] and bad_seen[2] is None
+        if resumed and ok and restarted and bad_ok:
+            print("✓ Download resume successful")
+            return True
+        print(f"✗ Download resume failed: {results}")
+        return False
+    except Exception as e:
+        print(f"✗ Download resume failed: {e}")
+        return False
+
+def test_icon_fallback():
+    """Test icon URLs are tried in preference order, falling through failed GETs"""
+    print("\nTesting icon fallback...")
+    
+    try:
+        import time
+        import install_cursor_appimage_v15 as installer
+        
+        def icon_server(body, get_status=200, head_delay=0.0):
+            class Handler(BaseHTTPRequestHandler):
+                def log_message(self, *args):
+                    pass
+                
+                def do_HEAD(self):
+                    time.sleep(head_delay)
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                
+                def do_GET(self):
+                    self.send_response(get_status)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+            
+            server = HTTPServer(("127.0.0.1", 0), Handler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            return server, f"http://127.0.0.1:{server.server_address[1]}/icon.png"
+        
+        scenarios = [
+            # Preferred URL probes fine but its GET fails: fall through to the next
+            ([(b"broken", 404, 0.0), (b"second", 200, 0.0)], b"second"),
+            # Both up: the preferred URL wins even when it answers the probe later
+            ([(b"first", 200, 0.3), (b"second", 200, 0.0)], b"first"),
+        ]
+        original = (installer.INSTALL_DIR, installer.ICON_PATH, installer.ICON_URLS)
+        results = []
+        for specs, expected in scenarios:
+            servers = [icon_server(*spec) for spec in specs]
+            with tempfile.TemporaryDirectory() as tmp:
+                installer.INSTALL_DIR = Path(tmp)
+                installer.ICON_PATH = Path(tmp) / "cursor.png"
+                installer.ICON_URLS = [url for _, url in servers]
+                try:
+                    installer.install_icon()
+                    results.append(installer.ICON_PATH.read_bytes() == expected)
+                finally:
+                    installer.INSTALL_DIR, installer.ICON_PATH, installer.ICON_URLS = original
+                    for server, _ in servers:
+                        server.shutdown()
+        
+        if all(results):
+            print("✓ Icon fallback successful")
+            return True
+        print(f"✗ Icon fallback failed: {results}")
+        return False
+    except BaseException as e:  # err() raises SystemExit
+        print(f"✗ Icon fallback failed: {e!r}")
+        return False
+
+def test_sha256_cache():
+    """Test that the checksum sidecar is reused and invalidated"""
+    print("\nTesting SHA256 cache...")
+    
+    try:
+        import hashlib
+        from install_cursor_appimage_v15 import cached_sha256sum, hash_cache_path
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cursor.AppImage"
+            path.write_bytes(b"first")
+            first = cached_sha256sum(path)
+            cached = hash_cache_path(path).exists()
+            path.write_bytes(b"second!")
+            second = cached_sha256sum(path)
+        
+        if (cached and first == hashlib.sha256(b"first").hexdigest()
+                and second == hashlib.sha256(b"second!").hexdigest()):
+            print("✓ SHA256 cache successful")
+            return True
+        print("✗ SHA256 cache failed")
+        return False
+    except Exception as e:
+        print(f"✗ SHA256 cache failed: {e}")
+        return False
+
+def test_core_sha256sum():
+    """Test both the mmap and the coreutils paths of the shared sha256sum"""
+    print("\nTesting shared SHA256 calculation...")
+    
+    try:
+        import install_cursor_core as core
+        
+        data = os.urandom(3 * 1024 * 1024 + 123)
+        expected = hashlib.sha256(data).hexdigest()
+        original = (core.MMAP_WINDOW, core.NATIVE_HASH_THRESHOLD)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cursor.AppImage"
+            path.write_bytes(data)
+            try:
+                # Several mmap windows, including a short last one
+                core.MMAP_WINDOW, core.NATIVE_HASH_THRESHOLD = 1 << 20, len(data)
+                mmap_hash = core.sha256sum(path)
+                # Force the coreutils path
+                core.NATIVE_HASH_THRESHOLD = 0
+                native_hash = core.sha256sum(path)
+            finally:
+                core.MMAP_WINDOW, core.NATIVE_HASH_THRESHOLD = original
+        
+        if mmap_hash == expected and native_hash == expected:
+            print("✓ Shared SHA256 calculation successful")
+            return True
+        print("✗ Shared SHA256 calculation failed")
+        return False
+    except Exception as e:
+        print(f"✗ Shared SHA256 calculation failed: {e}")
+        return False
+
+def test_core_download_resume():
+    """Test that an interrupted download resumes with a pinned Range request"""
+    print("\nTesting shared download resume...")
+    
+    try:
+        import install_cursor_core as core
+        
+        data = os.urandom(3 * core.CHUNK_SIZE + 17)
+        results = []
+        original_sleep = core.time.sleep
+        core.time.sleep = lambda seconds: None
+        try:
+            for misreport in (False, True):
+                server, url, seen = serve_bytes(data, break_first_at=core.CHUNK_SIZE + 5,
+                                                misreport_range=misreport)
+                try:
+                    with tempfile.TemporaryDirectory() as tmp:
+                        path = Path(tmp) / "cursor.AppImage"
+                        digest = core.download_with_progress(url, path, "Test download",
+                                                             fatal=False, hasher=hashlib.sha256())
+                        content = path.read_bytes()
+                finally:
+                    server.shutdown()
+                results.append((seen, server.if_ranges, content == data,
+                                digest == hashlib.sha256(data).hexdigest()))
+        finally:
+            core.time.sleep = original_sleep
+        
+        (seen, if_ranges, *ok), (bad_seen, _, *bad_ok) = results
+        # Resumed with If-Range; a bad Content-Range is refetched from byte 0
+        resumed = len(seen) == 2 and seen[0] is None and seen[1].startswith("bytes=")
+        restarted = len(bad_seen) == 3 and bad_seen[2] is None
+        if resumed and if_ranges[1] == '"v1"' and restarted and all(ok + bad_ok):
+            print("✓ Shared download resume successful")
+            return True
+        print(f"✗ Shared download resume failed: {results}")
+        return False
+    except Exception as e:
+        print(f"✗ Shared download resume failed: {e}")
+        return False
+
+def test_core_parallel_download():
+    """Test the ranged parallel download and its single-connection fallback"""
+    print("\nTesting shared parallel download...")
+    
+    try:
+        import install_cursor_core as core
+        
+        data = os.urandom(core.PARALLEL_CONNECTIONS * core.CHUNK_SIZE + 4321)
+        expected = hashlib.sha256(data).hexdigest()
+        results = []
+        cases = [
+            {},  # parallel path
+            {"ranges": False},  # no Accept-Ranges
+            {"etag": None},  # nothing to pin the ranges with If-Range
+            {"misreport_range": True},  # a range reply with the wrong Content-Range
+        ]
+        for options in cases:
+            server, url, seen = serve_bytes(data, **options)
+            try:
+                with tempfile.TemporaryDirectory() as tmp:
+                    path = Path(tmp) / "cursor.AppImage"
+                    parallel = core.parallel_download(url, path, "Test download")
+                    pinned = all(if_range == '"v1"' for if_range in server.if_ranges)
+                    digest = core.download_and_hash(url, path, "Test download")
+                    results.append((parallel, pinned, digest == expected,
+                                    path.read_bytes() == data))
+            finally:
+                server.shutdown()
+        
+        # Only the first case may use ranges; the others fall back cleanly
+        if results == [(True, True, True, True), (False, True, True, True),
+                       (False, True, True, True), (False, True, True, True)]:
+            print("✓ Shared parallel download successful")
+            return True
+        print(f"✗ Shared parallel download failed: {results}")
+        return False
+    except Exception as e:
+        print(f"✗ Shared parallel download failed: {e}")
+        return False
+
+def test_core_close_instances():
+    """Test that closing instances spares our ancestors and survives ENOSYS"""
+    print("\nTesting shared instance shutdown...")
+    
+    try:
+        import errno
+        import subprocess
+        import time
+        
+        pattern = f"cursor-test-{os.getpid()}"
+        here = os.path.dirname(os.path.abspath(__file__))
+        # The installer runs under a shell whose argv matches the pattern, as
+        # with a wrapper script or `bash -c "...cursor..."`
+        script = (
+            "import os, sys; sys.path.insert(0, os.environ['TEST_DIR']); "
+            "import install_cursor_core as core; "
+            "from pathlib import Path; "
+            "core.close_other_instances(core.InstallerConfig("
+            "install_dir=Path('/nonexistent'), process_pattern=os.environ['PATTERN']))"
+        )
+        results = []
+        for enosys in (False, True):
+            victim = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)", pattern])
+            code = script
+            if enosys:
+                code = ("import os, errno\n"
+                        "def no_pidfd(pid): raise OSError(errno.ENOSYS, 'Function not implemented')\n"
+                        "os.pidfd_open = no_pidfd\n") + script
+            try:
+                time.sleep(0.2)
+                shell = subprocess.run(
+                    ["sh", "-c", 'python3 -c "$1" && echo survived', pattern, code],
+                    capture_output=True, text=True, timeout=30,
+                    env=dict(os.environ, TEST_DIR=here, PATTERN=pattern,
+                             PATH=os.path.dirname(sys.executable) + os.pathsep + os.environ["PATH"]))
+                results.append(("survived" in shell.stdout, victim.wait(timeout=10) != 0))
+            finally:
+                if victim.poll() is None:
+                    victim.kill()
+        
+        if results == [(True, True), (True, True)]:
+            print("✓ Shared instance shutdown successful")
+            return True
+        print(f"✗ Shared instance shutdown failed: {results}")
+        return False
+    except Exception as e:
+        print(f"✗ Shared instance shutdown failed: {e}")
+        return False
+
+def test_core_close_instances_sigterm_only():
+    """Test that force_kill=False never escalates past SIGTERM"""
+    print("\nTesting shared instance shutdown without SIGKILL...")
+    
+    try:
+        import subprocess
+        import time
+        import install_cursor_core as core
+        
+        pattern = f"cursor-test-term-{os.getpid()}"
+        # e.g. an editor with "cursor" in its command line that ignores SIGTERM
+        stubborn = subprocess.Popen([
+            sys.executable, "-c",
+            "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(60)",
+            pattern,
+        ])
+        try:
+            time.sleep(0.5)
+            config = core.InstallerConfig(install_dir=Path("/nonexistent"),
+                                          process_pattern=pattern, force_kill=False)
+            core.close_other_instances(config)
+            alive = stubborn.poll() is None
+        finally:
+            stubborn.kill()
+            stubborn.wait()
+        
+        if alive:
+            print("✓ Shared instance shutdown without SIGKILL successful")
+            return True
+        print("✗ Shared instance shutdown without SIGKILL failed: process was killed")
+        return False
+    except BaseException as e:  # err() raises SystemExit
+        print(f"✗ Shared instance shutdown without SIGKILL failed: {e!r}")
+        return False
+
+def test_retry_policy():
+    """Test that the session retries a 503 but gives up on a 404 at once"""
+    print("\nTesting retry policy...")
+    
+    try:
+        from install_cursor_appimage_v15 import backoff_delay, make_session
+        
+        statuses = {"/missing": [404], "/flaky": [503, 200]}
+        hits = {path: 0 for path in statuses}
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                answers = statuses[self.path]
+                self.send_response(answers[min(hits[self.path], len(answers) - 1)])
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                hits[self.path] += 1
+        
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            session = make_session()
+            # Serve plain http through the production https adapter
+            session.mount("http://", session.get_adapter("https://www.cursor.com"))
+            missing = session.get(base + "/missing", timeout=5).status_code
+            flaky = session.get(base + "/flaky", timeout=5).status_code
+        finally:
+            server.shutdown()
+        
+        checks = [
+            missing == 404 and hits["/missing"] == 1,
+            flaky == 200 and hits["/flaky"] == 2,
+            1.0 <= backoff_delay(1) <= 1.5,
+            4.0 <= backoff_delay(3) <= 6.0,
+            backoff_delay(20) <= 45.0,
+        ]
+        
+        if all(checks):
+            print("✓ Retry policy successful")
+            return True
+        print(f"✗ Retry policy failed: {checks}")
+        return False
+    except Exception as e:
+        print(f"✗ Retry policy failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("Cursor AppImage Installer - Test Suite")
@@ -124,8 +603,18 @@ def main():
         test_system_requirements,
         test_dependency_check,
         test_api_connection,
+        test_api_cache,
         test_sha256_function,
+        test_sha256_cache,
         test_download_function,
+        test_download_resume,
+        test_icon_fallback,
+        test_retry_policy,
+        test_core_sha256sum,
+        test_core_download_resume,
+        test_core_parallel_download,
+        test_core_close_instances,
+        test_core_close_instances_sigterm_only,
     ]
     
     passed = 0